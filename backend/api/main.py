@@ -1,21 +1,32 @@
 from fastapi import FastAPI, Query, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from typing import List, Optional
+from fastapi.responses import JSONResponse, ORJSONResponse
+from typing import Dict, List, Optional, Set
 from pathlib import Path
 import json
+import math
+from collections import Counter
 from datetime import datetime
 import sys
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    orjson = None
+
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
 from models.schemas import ModelData, LeaderboardResponse, Benchmark
 
+# Serialize responses with orjson when it is available
+JSONResponseClass = ORJSONResponse if orjson is not None else JSONResponse
+
 app = FastAPI(
     title="ModelWatch API",
     description="API for open-source LLM leaderboard data",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=JSONResponseClass,
 )
 
 # CORS middleware for frontend
@@ -31,53 +42,40 @@ app.add_middleware(
 DATA_FILE = Path(__file__).parent.parent / "data" / "models.json"
 
 
-def load_data() -> dict:
-    """Load model data from JSON file"""
-    if not DATA_FILE.exists():
-        return {"models": [], "total_count": 0, "last_updated": None}
+# Parsed data file, reused until the file's mtime changes
+_CACHE = {
+    "mtime": None,
+    "raw": None,
+    "models": None,
+    "sort_orders": None,
+    "category_index": None,
+    "benchmark_count": None,
+    "by_id": None,
+    "benchmarks_summary": None,
+    "stats": None,
+    "last_updated_iso": None,
+}
 
-    with open(DATA_FILE, 'r', encoding='utf-8') as f:
-        return json.load(f)
 
+def _read_data_file() -> dict:
+    """Read and parse the JSON data file"""
+    if orjson is not None:
+        with open(DATA_FILE, 'rb') as f:
+            return orjson.loads(f.read())
 
-@app.get("/")
-async def root():
-    """API root endpoint"""
-    return {
-        "message": "ModelWatch API",
-        "version": "1.0.0",
-        "endpoints": {
-            "/models": "Get all models",
-            "/models/{model_id}": "Get specific model",
-            "/benchmarks": "Get all benchmark types",
-            "/stats": "Get statistics"
-        }
-    }
+    with open(DATA_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
 
 
-@app.get("/models", response_model=LeaderboardResponse)
-async def get_models(
-    limit: Optional[int] = Query(None, description="Limit number of results"),
-    offset: int = Query(0, description="Offset for pagination"),
-    sort_by: Optional[str] = Query("model_name", description="Sort by field"),
-    category: Optional[str] = Query(None, description="Filter by benchmark category"),
-    min_benchmarks: Optional[int] = Query(None, description="Minimum number of benchmarks"),
-):
+def _build_model_objects(data: dict) -> List[dict]:
     """
-    Get all models with optional filtering and sorting
+    Validate raw model dicts against ModelData, skipping invalid entries
 
-    - **limit**: Maximum number of models to return
-    - **offset**: Number of models to skip (for pagination)
-    - **sort_by**: Field to sort by (model_name, downloads, likes, etc.)
-    - **category**: Filter models that have benchmarks in this category
-    - **min_benchmarks**: Only return models with at least this many benchmarks
+    Models are validated once here and kept in their serialized form, so
+    requests can return them without another validation pass.
     """
-    data = load_data()
-    models = data.get('models', [])
-
-    # Convert to ModelData objects
     model_objects = []
-    for m in models:
+    for m in data.get('models', []):
         try:
             # Convert benchmarks
             benchmarks = [
@@ -101,75 +99,64 @@ async def get_models(
                 description=m.get('description'),
                 arxiv_id=m.get('arxiv_id')
             )
-            model_objects.append(model_obj)
+            model_objects.append(model_obj.model_dump(mode="json"))
         except Exception as e:
             print(f"Error parsing model {m.get('model_id')}: {e}")
             continue
 
-    # Apply filters
-    if category:
-        model_objects = [
-            m for m in model_objects
-            if any(b.category == category for b in m.benchmarks)
-        ]
+    return model_objects
 
-    if min_benchmarks is not None:
-        model_objects = [
-            m for m in model_objects
-            if len(m.benchmarks) >= min_benchmarks
-        ]
-
-    # Sort
-    if sort_by == "downloads":
-        model_objects.sort(key=lambda x: x.downloads or 0, reverse=True)
-    elif sort_by == "likes":
-        model_objects.sort(key=lambda x: x.likes or 0, reverse=True)
-    elif sort_by == "benchmarks":
-        model_objects.sort(key=lambda x: len(x.benchmarks), reverse=True)
-    else:
-        model_objects.sort(key=lambda x: x.model_name)
-
-    # Apply pagination
-    total = len(model_objects)
-    if limit:
-        model_objects = model_objects[offset:offset + limit]
-    else:
-        model_objects = model_objects[offset:]
 
-    # Parse last_updated
-    last_updated_str = data.get('last_updated')
-    try:
-        last_updated = datetime.fromisoformat(last_updated_str) if last_updated_str else datetime.utcnow()
-    except:
-        last_updated = datetime.utcnow()
-
-    return LeaderboardResponse(
-        models=model_objects,
-        total_count=total,
-        last_updated=last_updated
-    )
+def _build_indexes(model_objects: List[dict]) -> dict:
+    """
+    Precompute per-field sort orders and filter indexes over the model list
 
+    Sort orders are lists of positions into model_objects, so a request only
+    has to filter and slice indices rather than re-sort the full list. The
+    sort/filter fields are first pulled out into parallel columns, so the
+    sorts key on plain list lookups instead of per-model dict access.
+    """
+    indices = range(len(model_objects))
+
+    # Hot fields as parallel columns (struct of arrays)
+    names = [m['model_name'] for m in model_objects]
+    downloads = [m['downloads'] or 0 for m in model_objects]
+    likes = [m['likes'] or 0 for m in model_objects]
+    benchmark_count = [len(m['benchmarks']) for m in model_objects]
+
+    category_index: Dict[str, Set[int]] = {}
+    for i, m in enumerate(model_objects):
+        for b in m['benchmarks']:
+            category_index.setdefault(b['category'], set()).add(i)
+
+    sort_orders = {
+        "downloads": sorted(indices, key=downloads.__getitem__, reverse=True),
+        "likes": sorted(indices, key=likes.__getitem__, reverse=True),
+        "benchmarks": sorted(indices, key=benchmark_count.__getitem__, reverse=True),
+        "model_name": sorted(indices, key=names.__getitem__),
+    }
 
-@app.get("/models/{model_id:path}")
-async def get_model(model_id: str):
-    """Get detailed information about a specific model"""
-    data = load_data()
-    models = data.get('models', [])
+    return {
+        "sort_orders": sort_orders,
+        "category_index": category_index,
+        "benchmark_count": benchmark_count,
+    }
 
-    for m in models:
-        if m.get('model_id') == model_id:
-            return m
 
-    raise HTTPException(status_code=404, detail=f"Model {model_id} not found")
+def _build_id_index(data: dict) -> Dict[str, dict]:
+    """Map model_id to its raw model dict (first occurrence wins)"""
+    by_id = {}
+    for m in data.get('models', []):
+        by_id.setdefault(m.get('model_id'), m)
+    return by_id
 
 
-@app.get("/benchmarks")
-async def get_benchmarks():
-    """Get all unique benchmark types and categories"""
-    data = load_data()
+def _build_benchmarks_summary(data: dict) -> dict:
+    """Aggregate per-benchmark counts, average scores and categories"""
     models = data.get('models', [])
 
     benchmarks = {}
+    scores_by_name: Dict[str, List[float]] = {}
     categories = set()
 
     for model in models:
@@ -183,21 +170,20 @@ async def get_benchmarks():
                     'category': category,
                     'count': 0,
                     'avg_score': 0,
-                    'scores': []
                 }
+                scores_by_name[name] = []
 
             benchmarks[name]['count'] += 1
             score = bench.get('score')
             if score is not None:
-                benchmarks[name]['scores'].append(score)
+                scores_by_name[name].append(score)
 
             categories.add(category)
 
-    # Calculate averages
-    for bench in benchmarks.values():
-        if bench['scores']:
-            bench['avg_score'] = sum(bench['scores']) / len(bench['scores'])
-        del bench['scores']  # Remove raw scores from response
+    # Calculate averages (math.fsum sums in C and is correctly rounded)
+    for name, scores in scores_by_name.items():
+        if scores:
+            benchmarks[name]['avg_score'] = math.fsum(scores) / len(scores)
 
     return {
         'benchmarks': list(benchmarks.values()),
@@ -206,29 +192,163 @@ async def get_benchmarks():
     }
 
 
-@app.get("/stats")
-async def get_stats():
-    """Get overall statistics about the leaderboard"""
-    data = load_data()
+def _build_stats(data: dict) -> dict:
+    """Aggregate overall leaderboard statistics"""
     models = data.get('models', [])
 
     total_models = len(models)
     total_benchmarks = sum(len(m.get('benchmarks', [])) for m in models)
 
-    licenses = {}
-    for m in models:
-        license_name = m.get('license', 'Unknown')
-        licenses[license_name] = licenses.get(license_name, 0) + 1
+    licenses = Counter(m.get('license', 'Unknown') for m in models)
 
     return {
         'total_models': total_models,
         'total_benchmark_scores': total_benchmarks,
         'last_updated': data.get('last_updated'),
-        'licenses': licenses,
+        'licenses': dict(licenses),
         'models_with_benchmarks': sum(1 for m in models if m.get('benchmarks')),
     }
 
 
+def _normalize_last_updated(data: dict) -> str:
+    """Parse the file's last_updated once and return it as an ISO string"""
+    last_updated_str = data.get('last_updated')
+    try:
+        last_updated = datetime.fromisoformat(last_updated_str) if last_updated_str else datetime.utcnow()
+    except (TypeError, ValueError):
+        last_updated = datetime.utcnow()
+
+    return last_updated.isoformat()
+
+
+def load_data() -> dict:
+    """
+    Load model data from JSON file
+
+    The parsed file, its validated models and the derived indexes and
+    aggregates are cached in memory and only rebuilt when the file's mtime
+    changes, so new scraper output is picked up without re-parsing on every
+    request.
+    """
+    try:
+        mtime = DATA_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+
+    if _CACHE["raw"] is not None and _CACHE["mtime"] == mtime:
+        return _CACHE["raw"]
+
+    if mtime is None:
+        data = {"models": [], "total_count": 0, "last_updated": None}
+    else:
+        data = _read_data_file()
+
+    model_objects = _build_model_objects(data)
+    _CACHE.update(
+        mtime=mtime,
+        raw=data,
+        models=model_objects,
+        by_id=_build_id_index(data),
+        benchmarks_summary=_build_benchmarks_summary(data),
+        stats=_build_stats(data),
+        last_updated_iso=_normalize_last_updated(data),
+        **_build_indexes(model_objects),
+    )
+    return data
+
+
+@app.get("/")
+async def root():
+    """API root endpoint"""
+    return {
+        "message": "ModelWatch API",
+        "version": "1.0.0",
+        "endpoints": {
+            "/models": "Get all models",
+            "/models/{model_id}": "Get specific model",
+            "/benchmarks": "Get all benchmark types",
+            "/stats": "Get statistics"
+        }
+    }
+
+
+@app.get("/models", response_model=LeaderboardResponse)
+async def get_models(
+    limit: Optional[int] = Query(None, description="Limit number of results"),
+    offset: int = Query(0, description="Offset for pagination"),
+    sort_by: Optional[str] = Query("model_name", description="Sort by field"),
+    category: Optional[str] = Query(None, description="Filter by benchmark category"),
+    min_benchmarks: Optional[int] = Query(None, description="Minimum number of benchmarks"),
+):
+    """
+    Get all models with optional filtering and sorting
+
+    - **limit**: Maximum number of models to return
+    - **offset**: Number of models to skip (for pagination)
+    - **sort_by**: Field to sort by (model_name, downloads, likes, etc.)
+    - **category**: Filter models that have benchmarks in this category
+    - **min_benchmarks**: Only return models with at least this many benchmarks
+    """
+    load_data()
+    model_objects = _CACHE["models"]
+
+    # Pick the precomputed order for the sort field
+    sort_orders = _CACHE["sort_orders"]
+    order = sort_orders.get(sort_by, sort_orders["model_name"])
+
+    # Apply filters
+    if category:
+        members = _CACHE["category_index"].get(category, ())
+        order = [i for i in order if i in members]
+
+    if min_benchmarks is not None:
+        benchmark_count = _CACHE["benchmark_count"]
+        order = [i for i in order if benchmark_count[i] >= min_benchmarks]
+
+    # Apply pagination
+    total = len(order)
+    if limit:
+        order = order[offset:offset + limit]
+    else:
+        order = order[offset:]
+
+    model_objects = [model_objects[i] for i in order]
+
+    # Cached models are already validated; returning a response directly
+    # skips FastAPI's response_model validation and re-serialization
+    return JSONResponseClass({
+        'models': model_objects,
+        'total_count': total,
+        'last_updated': _CACHE["last_updated_iso"],
+    })
+
+
+@app.get("/models/{model_id:path}")
+async def get_model(model_id: str):
+    """Get detailed information about a specific model"""
+    load_data()
+
+    m = _CACHE["by_id"].get(model_id)
+    if m is None:
+        raise HTTPException(status_code=404, detail=f"Model {model_id} not found")
+
+    return m
+
+
+@app.get("/benchmarks")
+async def get_benchmarks():
+    """Get all unique benchmark types and categories"""
+    load_data()
+    return _CACHE["benchmarks_summary"]
+
+
+@app.get("/stats")
+async def get_stats():
+    """Get overall statistics about the leaderboard"""
+    load_data()
+    return _CACHE["stats"]
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
@@ -1,63 +1,258 @@
 import asyncio
 import re
+import time
+from pathlib import Path
 from typing import Dict, List, Optional
+import diskcache
 import httpx
 from bs4 import BeautifulSoup
 import json
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+try:
+    import lxml  # noqa: F401  (C-backed parser for BeautifulSoup)
+    _HTML_PARSER = 'lxml'
+except ImportError:  # lxml is optional; fall back to the pure-Python parser
+    _HTML_PARSER = 'html.parser'
+
+
+# Default location of the persistent scrape cache, next to the collected data
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / "data" / ".hf_scrape_cache"
+
+# Precompiled patterns used by the page extractors
+_LICENSE_HREF_RE = re.compile(r'/license')
+_LICENSE_YAML_RE = re.compile(r'license:\s*([^\n]+)')
+_CONTEXT_RE = re.compile(r'context[_ ](?:window|length)[:\s]*([0-9,]+)', re.IGNORECASE)
+_SCORE_RE = re.compile(r'(\d+\.?\d*)')
+# Common benchmark mentions, fused into one alternation so the text is scanned once
+_BENCH_RE = re.compile(
+    r'(?P<name>MMLU[- ]Pro|GPQA[- ]Diamond|SWE[- ]bench|HumanEval|AIME[- ]\d+|LiveCodeBench|GSM8K)'
+    r'[:\s]+(?P<score>[0-9.]+)%?',
+    re.IGNORECASE,
+)
+# Benchmark name keywords -> category, checked in priority order
+_CATEGORY_RULES = [
+    (re.compile(r'code|swe|humaneval|livecode'), 'coding'),
+    (re.compile(r'math|gsm|aime|hmmt'), 'reasoning'),
+    (re.compile(r'agent|tool|browse'), 'agents'),
+    (re.compile(r'mmlu|gpqa|reasoning'), 'reasoning'),
+]
+_DOWNLOADS_RE = re.compile(r'([0-9,]+)\s*downloads?', re.IGNORECASE)
+_LIKES_RE = re.compile(r'([0-9,]+)\s*likes?', re.IGNORECASE)
+# Raw-HTML patterns operate on the undecoded response bytes
+_PARAM_RES = [
+    re.compile(rb'(\d+\.?\d*[BMK])\s*parameters?', re.IGNORECASE),
+    re.compile(rb'parameters?[:\s]+(\d+\.?\d*[BMK])', re.IGNORECASE),
+]
+_ARXIV_RE = re.compile(rb'arxiv[:\s]+(\d+\.\d+)', re.IGNORECASE)
+_ARXIV_HREF_RE = re.compile(r'arxiv\.org')
+_ARXIV_ID_RE = re.compile(r'(\d+\.\d+)')
+
+
+def _retry_after_seconds(value: Optional[str], default: float = 2.0) -> float:
+    """Parse a Retry-After header (delay-seconds or HTTP-date) into seconds"""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return default
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket rate limiter shared by concurrent coroutines
+
+    Tokens refill continuously at rate_per_sec up to capacity, so short bursts
+    go through immediately while the long-run average stays at rate_per_sec.
+    The rate adapts to the server (AIMD): backoff() halves it after a throttled
+    response and recover() raises it back toward rate_per_sec step by step.
+    """
+
+    def __init__(self, rate_per_sec: float, capacity: int = 1, min_rate: Optional[float] = None):
+        self.rate = rate_per_sec
+        self.max_rate = rate_per_sec
+        self.min_rate = min_rate if min_rate is not None else rate_per_sec / 16
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._throttled_until = 0.0  # End of the current backoff window (monotonic time)
+        self._lock: Optional[asyncio.Lock] = None  # Created lazily inside the running loop
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        """Wait until a token is available, then consume it"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            self._refill()
+            # Loop, since a backoff() while sleeping can push tokens further down
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    def backoff(self, retry_after: Optional[float] = None):
+        """
+        Halve the rate after a throttled response
+
+        Concurrent requests throttled together count as one signal: calls
+        made while an earlier Retry-After is still pending are ignored.
+
+        Args:
+            retry_after: Seconds the server asked us to wait; no request is
+                let through before then
+        """
+        now = time.monotonic()
+        if now < self._throttled_until:
+            return
+
+        self._refill()
+        self.rate = max(self.min_rate, self.rate / 2)
+        if retry_after:
+            # Go into token debt that takes retry_after seconds to pay off,
+            # unless existing debt already holds requests back that long
+            self._tokens = min(self._tokens, -retry_after * self.rate)
+            self._throttled_until = now + retry_after
+
+    def recover(self):
+        """Raise the rate a step back toward its ceiling after a successful response"""
+        if self.rate < self.max_rate:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
 
 
 class HuggingFaceScraper:
     """Scraper for HuggingFace model pages"""
 
-    def __init__(self, delay_between_requests: float = 0.5):
+    def __init__(
+        self,
+        requests_per_second: float = 6.0,
+        burst: int = 3,
+        max_connections: int = 10,
+        cache_dir: Path = DEFAULT_CACHE_DIR,
+        cache_ttl: int = 86400,
+        not_found_ttl: int = 3600,
+        rate_limiter: Optional[AsyncTokenBucket] = None,
+    ):
         self.base_url = "https://huggingface.co"
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
         }
-        self.delay = delay_between_requests  # Delay between requests to avoid rate limiting
+        # Shared rate limit across all concurrent requests to avoid being throttled;
+        # callers can pass their own bucket to share one budget with other requests
+        self._bucket = rate_limiter or AsyncTokenBucket(requests_per_second, capacity=burst)
+        self.max_connections = max_connections
         self._cache = {}  # Cache to avoid refetching same models
-
-    async def scrape_model(self, model_id: str) -> Optional[Dict]:
+        self._fetched_at: Dict[str, float] = {}  # When each cached result was fetched or revalidated
+        # Persistent cache so re-runs skip models scraped recently; stale
+        # entries are revalidated with a conditional GET
+        self._disk = diskcache.Cache(str(cache_dir))
+        self.cache_ttl = cache_ttl  # Seconds a scraped result is used without revalidating
+        self.not_found_ttl = not_found_ttl  # Shorter TTL for 404s
+        self._client: Optional[httpx.AsyncClient] = None  # Shared client, opened by __aenter__
+
+    async def __aenter__(self) -> "HuggingFaceScraper":
+        """Open one pooled HTTP/2 client shared by every request in this session"""
+        self._client = httpx.AsyncClient(
+            timeout=30.0,
+            follow_redirects=True,
+            http2=True,
+            headers=self.headers,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._client.aclose()
+        self._client = None
+
+    async def scrape_model(self, model_id: str, client: Optional[httpx.AsyncClient] = None) -> Optional[Dict]:
         """
         Scrape detailed information from a HuggingFace model page
 
         Args:
             model_id: HuggingFace model ID (e.g., "zai-org/GLM-4.7")
+            client: Caller-owned client to send the request with (defaults to the session client)
 
         Returns:
             Dictionary containing model information
         """
-        # Check cache first
+        # Check cache first, then results persisted by earlier runs
         if model_id in self._cache:
             return self._cache[model_id]
 
-        url = f"{self.base_url}/{model_id}"
-
-        try:
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                # Add delay to avoid rate limiting
-                await asyncio.sleep(self.delay)
-
-                print(f"Fetching {url}")
-                response = await client.get(url, headers=self.headers)
+        entry = self._disk.get(model_id)
+        if entry is not None:
+            ttl = self.cache_ttl if entry['result'] is not None else self.not_found_ttl
+            if time.time() - entry['fetched_at'] < ttl:
+                self._cache[model_id] = entry['result']
+                self._fetched_at[model_id] = entry['fetched_at']
+                return entry['result']
 
-                if response.status_code == 404:
-                    # Cache 404s to avoid retrying
-                    self._cache[model_id] = None
-                    return None
+        # Called outside a session: open a client just for this request
+        client = client or self._client
+        if client is None:
+            async with self:
+                return await self.scrape_model(model_id)
 
-                if response.status_code == 429:
-                    print(f"Rate limited on {model_id}, waiting...")
-                    await asyncio.sleep(2)
-                    return None
-
-                response.raise_for_status()
-                result = self._parse_model_page(response.text, model_id)
+        url = f"{self.base_url}/{model_id}"
 
-                # Cache successful results
-                self._cache[model_id] = result
-                return result
+        try:
+            # Wait for a rate-limit token
+            await self._bucket.acquire()
+
+            # Revalidate a stale cache entry instead of re-downloading it
+            conditional = {}
+            if entry is not None and entry['result'] is not None:
+                if entry.get('etag'):
+                    conditional['If-None-Match'] = entry['etag']
+                if entry.get('last_modified'):
+                    conditional['If-Modified-Since'] = entry['last_modified']
+
+            print(f"Fetching {url}")
+            response = await client.get(url, headers={**self.headers, **conditional})
+
+            if response.status_code in (429, 503):
+                # Slow every request sharing the bucket down, honouring Retry-After
+                retry_after = _retry_after_seconds(response.headers.get('retry-after'))
+                print(f"Throttled on {model_id} ({response.status_code}), backing off for {retry_after:g}s")
+                self._bucket.backoff(retry_after)
+                return None
+
+            # The server is keeping up; creep back toward the full rate
+            self._bucket.recover()
+
+            if response.status_code == 304 and conditional:
+                # Page unchanged: reuse the cached result, skip parsing
+                self._store(model_id, entry['result'], response, previous=entry)
+                return entry['result']
+
+            if response.status_code == 404:
+                # Cache 404s to avoid retrying
+                self._store(model_id, None, response)
+                return None
+
+            response.raise_for_status()
+            result = self._parse_model_page(response.content, model_id)
+
+            # Cache successful results
+            self._store(model_id, result, response)
+            return result
 
         except httpx.HTTPError as e:
             if '429' in str(e):
@@ -69,9 +264,44 @@ class HuggingFaceScraper:
             print(f"Error fetching {model_id}: {e}")
             return None
 
-    def _parse_model_page(self, html: str, model_id: str) -> Dict:
-        """Parse HuggingFace model page HTML"""
-        soup = BeautifulSoup(html, 'html.parser')
+    def _store(
+        self,
+        model_id: str,
+        result: Optional[Dict],
+        response: httpx.Response,
+        previous: Optional[Dict] = None,
+    ):
+        """
+        Cache a scrape result in memory and on disk with its validators
+
+        Args:
+            model_id: HuggingFace model ID
+            result: Parsed model data, or None for a missing model
+            response: Response the result was fetched or revalidated with
+            previous: Disk entry being revalidated; its validators are kept
+                when a 304 doesn't repeat them
+        """
+        previous = previous or {}
+        fetched_at = time.time()
+        self._cache[model_id] = result
+        self._fetched_at[model_id] = fetched_at
+        self._disk.set(model_id, {
+            'result': result,
+            'etag': response.headers.get('etag') or previous.get('etag'),
+            'last_modified': response.headers.get('last-modified') or previous.get('last_modified'),
+            'fetched_at': fetched_at,
+        })
+
+    def fetched_at(self, model_id: str) -> Optional[float]:
+        """Unix time the cached result for model_id was fetched or last revalidated, if known"""
+        return self._fetched_at.get(model_id)
+
+    def _parse_model_page(self, html: bytes, model_id: str) -> Dict:
+        """Parse HuggingFace model page HTML (raw response bytes)"""
+        soup = BeautifulSoup(html, _HTML_PARSER)
+
+        # Materialize the page text once; several extractors regex over it
+        page_text = soup.get_text()
 
         model_data = {
             'model_id': model_id,
@@ -82,17 +312,17 @@ class HuggingFaceScraper:
         }
 
         # Extract license
-        license_info = self._extract_license(soup)
+        license_info = self._extract_license(soup, page_text)
         if license_info:
             model_data['license'] = license_info
             model_data['is_open_source'] = self._is_open_source_license(license_info)
 
         # Extract model card metadata
-        metadata = self._extract_metadata(soup)
+        metadata = self._extract_metadata(soup, page_text)
         model_data.update(metadata)
 
         # Extract benchmarks from tables
-        benchmarks = self._extract_benchmarks(soup)
+        benchmarks = self._extract_benchmarks(soup, page_text)
         model_data['benchmarks'] = benchmarks
 
         # Extract model description
@@ -101,7 +331,7 @@ class HuggingFaceScraper:
             model_data['description'] = description
 
         # Extract stats (downloads, likes)
-        stats = self._extract_stats(soup)
+        stats = self._extract_stats(soup, page_text)
         model_data.update(stats)
 
         # Extract parameters/size
@@ -116,10 +346,10 @@ class HuggingFaceScraper:
 
         return model_data
 
-    def _extract_license(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_license(self, soup: BeautifulSoup, page_text: str) -> Optional[str]:
         """Extract license information"""
         # Look for license tag or metadata
-        license_element = soup.find('a', href=re.compile(r'/license'))
+        license_element = soup.find('a', href=_LICENSE_HREF_RE)
         if license_element:
             return license_element.text.strip()
 
@@ -129,7 +359,7 @@ class HuggingFaceScraper:
             return meta_license.get('content', '').strip()
 
         # Look in model card YAML
-        yaml_match = re.search(r'license:\s*([^\n]+)', soup.text)
+        yaml_match = _LICENSE_YAML_RE.search(page_text)
         if yaml_match:
             return yaml_match.group(1).strip()
 
@@ -144,13 +374,13 @@ class HuggingFaceScraper:
         license_lower = license_name.lower()
         return any(oss in license_lower for oss in open_source_licenses)
 
-    def _extract_metadata(self, soup: BeautifulSoup) -> Dict:
+    def _extract_metadata(self, soup: BeautifulSoup, page_text: str) -> Dict:
         """Extract model card metadata"""
         metadata = {}
 
         # Look for key-value pairs in the page
         # Context length
-        context_match = re.search(r'context[_ ](?:window|length)[:\s]*([0-9,]+)', soup.text, re.IGNORECASE)
+        context_match = _CONTEXT_RE.search(page_text)
         if context_match:
             context_str = context_match.group(1).replace(',', '')
             try:
@@ -160,7 +390,7 @@ class HuggingFaceScraper:
 
         return metadata
 
-    def _extract_benchmarks(self, soup: BeautifulSoup) -> List[Dict]:
+    def _extract_benchmarks(self, soup: BeautifulSoup, page_text: str) -> List[Dict]:
         """Extract benchmark scores from tables"""
         benchmarks = []
 
@@ -177,7 +407,7 @@ class HuggingFaceScraper:
                     score_text = cells[1].text.strip()
 
                     # Try to extract numeric score
-                    score_match = re.search(r'(\d+\.?\d*)', score_text)
+                    score_match = _SCORE_RE.search(score_text)
                     if score_match:
                         try:
                             score = float(score_match.group(1))
@@ -194,49 +424,32 @@ class HuggingFaceScraper:
                             pass
 
         # Also look for benchmark mentions in text
-        text_benchmarks = self._extract_benchmarks_from_text(soup.text)
+        text_benchmarks = self._extract_benchmarks_from_text(page_text)
         benchmarks.extend(text_benchmarks)
 
-        # Remove duplicates
-        seen = set()
-        unique_benchmarks = []
-        for b in benchmarks:
-            key = (b['name'], b['score'])
-            if key not in seen:
-                seen.add(key)
-                unique_benchmarks.append(b)
+        # Remove duplicates (dicts keep first-insertion order; duplicate
+        # entries are identical since category is derived from the name)
+        unique_benchmarks = {(b['name'], b['score']): b for b in benchmarks}
 
-        return unique_benchmarks
+        return list(unique_benchmarks.values())
 
     def _extract_benchmarks_from_text(self, text: str) -> List[Dict]:
         """Extract benchmark scores from text content"""
         benchmarks = []
 
-        # Common benchmark patterns
-        patterns = [
-            r'(MMLU[- ]Pro)[:\s]+([0-9.]+)%?',
-            r'(GPQA[- ]Diamond)[:\s]+([0-9.]+)%?',
-            r'(SWE[- ]bench)[:\s]+([0-9.]+)%?',
-            r'(HumanEval)[:\s]+([0-9.]+)%?',
-            r'(AIME[- ]\d+)[:\s]+([0-9.]+)%?',
-            r'(LiveCodeBench)[:\s]+([0-9.]+)%?',
-            r'(GSM8K)[:\s]+([0-9.]+)%?',
-        ]
-
-        for pattern in patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                name = match.group(1).strip()
-                try:
-                    score = float(match.group(2))
-                    category = self._categorize_benchmark(name)
-                    benchmarks.append({
-                        'name': name,
-                        'score': score,
-                        'category': category
-                    })
-                except ValueError:
-                    pass
+        # Single pass over the text for all common benchmark patterns
+        for match in _BENCH_RE.finditer(text):
+            name = match.group('name').strip()
+            try:
+                score = float(match.group('score'))
+                category = self._categorize_benchmark(name)
+                benchmarks.append({
+                    'name': name,
+                    'score': score,
+                    'category': category
+                })
+            except ValueError:
+                pass
 
         return benchmarks
 
@@ -244,16 +457,11 @@ class HuggingFaceScraper:
         """Categorize benchmark by type"""
         name_lower = name.lower()
 
-        if any(x in name_lower for x in ['code', 'swe', 'humaneval', 'livecode']):
-            return 'coding'
-        elif any(x in name_lower for x in ['math', 'gsm', 'aime', 'hmmt']):
-            return 'reasoning'
-        elif any(x in name_lower for x in ['agent', 'tool', 'browse']):
-            return 'agents'
-        elif any(x in name_lower for x in ['mmlu', 'gpqa', 'reasoning']):
-            return 'reasoning'
-        else:
-            return 'general'
+        for pattern, category in _CATEGORY_RULES:
+            if pattern.search(name_lower):
+                return category
+
+        return 'general'
 
     def _extract_description(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract model description"""
@@ -271,12 +479,12 @@ class HuggingFaceScraper:
 
         return None
 
-    def _extract_stats(self, soup: BeautifulSoup) -> Dict:
+    def _extract_stats(self, soup: BeautifulSoup, page_text: str) -> Dict:
         """Extract download and like stats"""
         stats = {}
 
         # Look for downloads
-        downloads_match = re.search(r'([0-9,]+)\s*downloads?', soup.text, re.IGNORECASE)
+        downloads_match = _DOWNLOADS_RE.search(page_text)
         if downloads_match:
             try:
                 downloads = int(downloads_match.group(1).replace(',', ''))
@@ -285,7 +493,7 @@ class HuggingFaceScraper:
                 pass
 
         # Look for likes
-        likes_match = re.search(r'([0-9,]+)\s*likes?', soup.text, re.IGNORECASE)
+        likes_match = _LIKES_RE.search(page_text)
         if likes_match:
             try:
                 likes = int(likes_match.group(1).replace(',', ''))
@@ -295,65 +503,70 @@ class HuggingFaceScraper:
 
         return stats
 
-    def _extract_parameters(self, soup: BeautifulSoup, html: str) -> Optional[str]:
+    def _extract_parameters(self, soup: BeautifulSoup, html: bytes) -> Optional[str]:
         """Extract model parameter count"""
         # Look for parameter mentions
-        param_patterns = [
-            r'(\d+\.?\d*[BMK])\s*parameters?',
-            r'parameters?[:\s]+(\d+\.?\d*[BMK])',
-        ]
-
-        for pattern in param_patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
+        for pattern in _PARAM_RES:
+            match = pattern.search(html)
             if match:
-                return match.group(1).upper()
+                return match.group(1).decode('ascii').upper()
 
         return None
 
-    def _extract_arxiv(self, soup: BeautifulSoup, html: str) -> Optional[str]:
+    def _extract_arxiv(self, soup: BeautifulSoup, html: bytes) -> Optional[str]:
         """Extract arXiv ID"""
-        arxiv_match = re.search(r'arxiv[:\s]+(\d+\.\d+)', html, re.IGNORECASE)
+        arxiv_match = _ARXIV_RE.search(html)
         if arxiv_match:
-            return arxiv_match.group(1)
+            return arxiv_match.group(1).decode('ascii')
 
         # Look for arxiv links
-        arxiv_link = soup.find('a', href=re.compile(r'arxiv\.org'))
+        arxiv_link = soup.find('a', href=_ARXIV_HREF_RE)
         if arxiv_link:
-            link_match = re.search(r'(\d+\.\d+)', arxiv_link.get('href', ''))
+            link_match = _ARXIV_ID_RE.search(arxiv_link.get('href', ''))
             if link_match:
                 return link_match.group(1)
 
         return None
 
-    async def scrape_models_batch(self, model_ids: List[str], max_concurrent: int = 3) -> List[Dict]:
+    async def scrape_models_batch(
+        self,
+        model_ids: List[str],
+        max_concurrent: int = 3,
+        client: Optional[httpx.AsyncClient] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> List[Dict]:
         """
         Scrape multiple models with rate limiting
 
         Args:
             model_ids: List of HuggingFace model IDs
             max_concurrent: Maximum concurrent requests
+            client: Caller-owned pooled client to reuse; it is not closed here
+            semaphore: Caller-owned semaphore bounding in-flight requests
+                across several concurrent batches (overrides max_concurrent)
 
         Returns:
             List of model data dictionaries
         """
+        # Reuse one client (and its connections) for the whole batch
+        if client is None and self._client is None:
+            async with self:
+                return await self.scrape_models_batch(model_ids, max_concurrent, semaphore=semaphore)
+
         # Remove duplicates while preserving order
         unique_ids = list(dict.fromkeys(model_ids))
 
         print(f"  Fetching {len(unique_ids)} unique models (de-duped from {len(model_ids)} IDs)")
 
-        results = []
-
-        # Process in batches to limit concurrent requests
-        for i in range(0, len(unique_ids), max_concurrent):
-            batch = unique_ids[i:i + max_concurrent]
-            batch_results = await asyncio.gather(*[self.scrape_model(model_id) for model_id in batch])
-            results.extend([r for r in batch_results if r is not None])
+        # Bound in-flight requests; a slow page only holds up its own slot
+        semaphore = semaphore or asyncio.Semaphore(max_concurrent)
 
-            # Small delay between batches
-            if i + max_concurrent < len(unique_ids):
-                await asyncio.sleep(0.5)
+        async def scrape_bounded(model_id: str) -> Optional[Dict]:
+            async with semaphore:
+                return await self.scrape_model(model_id, client)
 
-        return results
+        batch_results = await asyncio.gather(*[scrape_bounded(model_id) for model_id in unique_ids])
+        return [r for r in batch_results if r is not None]
 
 
 if __name__ == "__main__":
@@ -1,5 +1,10 @@
 import asyncio
-import json
+import heapq
+import logging
+import mmap
+import sys
+import httpx
+import orjson
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict
@@ -13,7 +18,7 @@ class LLMStatsOrchestrator:
     def __init__(self, output_file: str = "../data/models.json"):
         self.output_file = Path(__file__).parent / output_file
         self.llmstats_scraper = LLMStatsScraper(headless=True)
-        self.hf_scraper = HuggingFaceScraper(delay_between_requests=0.5)
+        self.hf_scraper = HuggingFaceScraper(requests_per_second=6.0)
 
     async def collect_all_data(self, enrich_with_hf: bool = True) -> List[Dict]:
         """
@@ -29,37 +34,69 @@ class LLMStatsOrchestrator:
         print("Starting data collection from llm-stats.com...")
         print("=" * 60)
 
-        # Step 1: Scrape llm-stats.com leaderboard
+        # Step 1: Scrape llm-stats.com leaderboard. With enrichment on, each
+        # batch's HuggingFace lookups start as soon as the batch arrives
+        # (step 2), overlapping the rest of the llm-stats scrape.
         print("\n[1/2] Scraping llm-stats.com leaderboard...")
-        models = await self.llmstats_scraper.scrape_leaderboard()
-
-        if not models:
-            print("⚠️  No models found from llm-stats.com")
-            return []
-
-        print(f"✓ Scraped {len(models)} models from llm-stats.com")
-
-        # Step 2: Optionally enrich with HuggingFace data
-        if enrich_with_hf:
-            print(f"\n[2/2] Enriching with HuggingFace data...")
-            print("This will add detailed model information and additional benchmarks")
-            models = await self._enrich_with_huggingface(models)
+        models = []
+        hf_tasks = []
+        # One bound on in-flight HuggingFace requests across every batch, and
+        # each model ID is only looked up once even if it recurs in a later batch
+        hf_semaphore = asyncio.Semaphore(8)
+        hf_requested = set()
+
+        # One pooled HTTP/2 client shared by every HuggingFace lookup in this run
+        async with httpx.AsyncClient(
+            timeout=30.0,
+            follow_redirects=True,
+            http2=True,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+        ) as client:
+            try:
+                async for batch in self.llmstats_scraper.stream_models():
+                    models.extend(batch)
+                    if enrich_with_hf:
+                        model_ids = []
+                        for m in batch:
+                            model_id = m.get('model_id')
+                            if model_id and model_id not in hf_requested:
+                                hf_requested.add(model_id)
+                                model_ids.append(model_id)
+                        if model_ids:
+                            hf_tasks.append(asyncio.create_task(
+                                self.hf_scraper.scrape_models_batch(
+                                    model_ids, client=client, semaphore=hf_semaphore
+                                )
+                            ))
+
+                if not models:
+                    print("⚠️  No models found from llm-stats.com")
+                    return []
+
+                print(f"✓ Scraped {len(models)} models from llm-stats.com")
+
+                # Step 2: Optionally enrich with HuggingFace data
+                if enrich_with_hf:
+                    print(f"\n[2/2] Enriching with HuggingFace data...")
+                    print("This will add detailed model information and additional benchmarks")
+                    print(f"Attempting to enrich {len(models)} models with HuggingFace data...")
+                    hf_batches = await asyncio.gather(*hf_tasks)
+                    hf_models = [m for hf_batch in hf_batches for m in hf_batch]
+                    models = self._enrich_with_huggingface(models, hf_models)
+            finally:
+                # If the scrape failed part-way, stop any enrichment still in
+                # flight before its client closes
+                for task in hf_tasks:
+                    task.cancel()
+                await asyncio.gather(*hf_tasks, return_exceptions=True)
 
         # Save data
-        self._save_data(models)
+        await self._save_data(models)
 
         return models
 
-    async def _enrich_with_huggingface(self, models: List[Dict]) -> List[Dict]:
-        """Enrich model data with HuggingFace information"""
-
-        # Extract model IDs
-        model_ids = [m['model_id'] for m in models if m.get('model_id')]
-
-        print(f"Attempting to enrich {len(model_ids)} models with HuggingFace data...")
-
-        # Fetch HuggingFace data
-        hf_models = await self.hf_scraper.scrape_models_batch(model_ids, max_concurrent=3)
+    def _enrich_with_huggingface(self, models: List[Dict], hf_models: List[Dict]) -> List[Dict]:
+        """Enrich model data with scraped HuggingFace information"""
 
         # Create a mapping of model_id to HuggingFace data
         hf_data_map = {m['model_id']: m for m in hf_models if m.get('model_id')}
@@ -70,41 +107,36 @@ class LLMStatsOrchestrator:
 
         for model in models:
             model_id = model.get('model_id', '')
+            model['hf_url'] = f"https://huggingface.co/{model_id}"
 
             # Check if we have HuggingFace data for this model
-            if model_id in hf_data_map:
-                hf_data = hf_data_map[model_id]
-
-                # Merge data, preserving llm-stats.com benchmarks as primary
+            hf_data = hf_data_map.get(model_id)
+            if hf_data is not None:
+                # Merge in place, preserving llm-stats.com benchmarks as primary
                 # and adding HuggingFace data as secondary
-                merged_model = {
-                    **model,
-                    'hf_license': hf_data.get('license'),
-                    'hf_parameters': hf_data.get('parameters'),
-                    'hf_context_window': hf_data.get('context_window'),
-                    'hf_downloads': hf_data.get('downloads'),
-                    'hf_likes': hf_data.get('likes'),
-                    'hf_created_at': hf_data.get('created_at'),
-                    'hf_last_modified': hf_data.get('last_modified'),
-                    'hf_url': f"https://huggingface.co/{model_id}",
-                }
+                model.update(
+                    hf_license=hf_data.get('license'),
+                    hf_parameters=hf_data.get('parameters'),
+                    hf_context_window=hf_data.get('context_window'),
+                    hf_downloads=hf_data.get('downloads'),
+                    hf_likes=hf_data.get('likes'),
+                    hf_created_at=hf_data.get('created_at'),
+                    hf_last_modified=hf_data.get('last_modified'),
+                )
 
                 # Add HuggingFace benchmarks as additional data (not replacing llm-stats benchmarks)
                 if hf_data.get('benchmarks'):
-                    merged_model['hf_benchmarks'] = hf_data['benchmarks']
+                    model['hf_benchmarks'] = hf_data['benchmarks']
 
-                enriched_models.append(merged_model)
                 hf_enriched_count += 1
-            else:
-                # Keep original model data, add HuggingFace URL anyway
-                model['hf_url'] = f"https://huggingface.co/{model_id}"
-                enriched_models.append(model)
+
+            enriched_models.append(model)
 
         print(f"✓ Successfully enriched {hf_enriched_count}/{len(models)} models with HuggingFace data")
 
         return enriched_models
 
-    def _save_data(self, models: List[Dict]):
+    async def _save_data(self, models: List[Dict]):
         """Save collected data to JSON file"""
 
         # Calculate statistics
@@ -127,9 +159,11 @@ class LLMStatsOrchestrator:
         # Ensure output directory exists
         self.output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Save to JSON
-        with open(self.output_file, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        # Save to JSON (orjson emits UTF-8 bytes, like ensure_ascii=False)
+        payload = orjson.dumps(output_data, option=orjson.OPT_INDENT_2)
+
+        # Write from a worker thread so the event loop isn't blocked on disk I/O
+        await asyncio.to_thread(self.output_file.write_bytes, payload)
 
         print(f"\n✓ Data saved to {self.output_file}")
         print(f"  Total models: {len(models)}")
@@ -142,8 +176,16 @@ class LLMStatsOrchestrator:
         if not self.output_file.exists():
             return {'models': [], 'total_count': 0}
 
-        with open(self.output_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(self.output_file, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Empty files (and platforms without mmap support) can't be mapped
+                return orjson.loads(f.read())
+
+            # Parse straight from the page cache, without copying into a bytes object
+            with mm, memoryview(mm) as view:
+                return orjson.loads(view)
 
 
 async def main():
@@ -166,25 +208,31 @@ async def main():
         print(f"  Total models: {len(models)}")
 
         if models:
-            with_benchmarks = sum(1 for m in models if m.get('benchmarks'))
-            print(f"  Models with benchmarks: {with_benchmarks}")
+            # Tally every counter in a single pass over the models
+            with_benchmarks = 0
+            total_benchmarks = 0
+            hf_enriched = 0
+            for m in models:
+                benchmark_count = len(m.get('benchmarks', []))
+                with_benchmarks += benchmark_count > 0
+                total_benchmarks += benchmark_count
+                hf_enriched += bool(m.get('hf_license') or m.get('hf_benchmarks'))
 
-            total_benchmarks = sum(len(m.get('benchmarks', [])) for m in models)
+            print(f"  Models with benchmarks: {with_benchmarks}")
             print(f"  Total benchmark scores: {total_benchmarks}")
-
-            hf_enriched = sum(1 for m in models if m.get('hf_license') or m.get('hf_benchmarks'))
             print(f"  HuggingFace enriched: {hf_enriched}")
 
-            # Show top models by benchmark count
-            models_sorted = sorted(
+            # Show top models by benchmark count (only the top 5 are needed,
+            # so skip sorting the whole list)
+            top_models = heapq.nlargest(
+                5,
                 models,
                 key=lambda x: len(x.get('benchmarks', [])),
-                reverse=True
             )
 
-            if models_sorted:
+            if top_models:
                 print("\n📝 Top 5 models by benchmark count:")
-                for model in models_sorted[:5]:
+                for model in top_models:
                     print(f"  - {model['model_name']}")
                     print(f"    Organization: {model.get('organization', 'N/A')}")
                     print(f"    Benchmarks: {len(model.get('benchmarks', []))}")
@@ -198,4 +246,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Show the scrapers' progress messages
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     asyncio.run(main())
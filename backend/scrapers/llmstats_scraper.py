@@ -1,17 +1,189 @@
 import asyncio
 import json
+import logging
+import math
 import re
-from typing import List, Dict, Optional
-from playwright.async_api import async_playwright, Page, TimeoutError as PlaywrightTimeoutError
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import AsyncIterator, List, Dict, Optional
+import httpx
+import orjson
+from bs4 import BeautifulSoup
+from playwright.async_api import (
+    async_playwright, Browser, BrowserContext, Page, Playwright, Route,
+    TimeoutError as PlaywrightTimeoutError,
+)
+
+try:
+    import lxml  # noqa: F401  (C-backed parser for BeautifulSoup)
+    _HTML_PARSER = 'lxml'
+except ImportError:  # lxml is optional; fall back to the pure-Python parser
+    _HTML_PARSER = 'html.parser'
+
+logger = logging.getLogger(__name__)
+
+
+# Parsed leaderboard cache, revalidated against the page's ETag/Last-Modified
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / "data"
+LEADERBOARD_CACHE_FILE = ".llmstats_leaderboard.json"
+
+# Precompiled patterns for cell and page-source parsing
+_SCORE_RE = re.compile(r'-?\d+\.?\d*')
+_PRICE_RE = re.compile(r'\$?(\d+\.?\d*)')
+_WS_RE = re.compile(r'\s+')
+_JSON_RE = re.compile(r'(?:data|models|leaderboard)\s*[=:]\s*(\[{.*?}\])', re.DOTALL)
+
+# Comprehensive org mapping for HuggingFace, checked in order (first match wins)
+_ORG_MAPPING = {
+    # Chinese models
+    "glm": "THUDM",  # GLM-4.7 -> THUDM/glm-4-9b-chat
+    "kimi": "MoonshotAI",  # Kimi -> MoonshotAI
+    "mimo": "AIDC-AI",  # MiMo -> AIDC-AI
+    "qwen": "Qwen",
+    "yi": "01-ai",
+    "deepseek": "deepseek-ai",
+
+    # Western models
+    "llama": "meta-llama",
+    "mistral": "mistralai",
+    "mixtral": "mistralai",
+    "gemma": "google",
+    "gemini": "google",
+    "phi": "microsoft",
+    "gpt": "openai",
+    "claude": "anthropic",
+
+    # Other orgs
+    "nemotron": "nvidia",
+    "hermes": "NousResearch",
+    "nous": "NousResearch",
+    "solar": "upstage",
+    "commandr": "CohereForAI",
+    "aya": "CohereForAI",
+}
+
+# Common benchmark names for llm-stats.com, assigned to score columns in order
+# when a row can't be matched up with the table's header row
+_BENCHMARK_NAMES = (
+    "MMLU", "Arc-Challenge", "HellaSwag", "TruthfulQA", "Winogrande", "GSM8K",
+    "GPQA", "AIME", "MATH", "HumanEval",
+)
+
+# Resource types the leaderboard table doesn't need; aborting them keeps
+# "networkidle" from waiting on images, fonts and styling
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+
+# Resolves once the row count is non-zero and unchanged between two polls,
+# i.e. the client-side render has settled
+_ROWS_STABLE_JS = """() => {
+    const n = document.querySelectorAll("table tbody tr, [role='row']").length;
+    const stable = n > 0 && n === window.__mwLastRowCount;
+    window.__mwLastRowCount = n;
+    return stable;
+}"""
+
+# Column header texts, used to name each row's score cells
+_HEADERS_JS = """() => Array.from(
+    document.querySelectorAll("table thead th, [role='columnheader']"),
+    th => th.innerText
+)"""
+
+# Collects every row's cell texts in the browser, so extraction is a single
+# Playwright round-trip instead of one per row and per cell
+_ROWS_JS = """() => {
+    let rows = document.querySelectorAll("table tbody tr, [role='row']");
+    if (!rows.length) {
+        rows = document.querySelectorAll("tr.model-row, .leaderboard-item, [data-model]");
+    }
+    return Array.from(rows, row =>
+        Array.from(row.querySelectorAll("td, [role='cell']"), cell => cell.innerText)
+    );
+}"""
+
+
+@lru_cache(maxsize=1024)
+def _extract_model_id(model_name: str) -> str:
+    """Extract or construct model ID matching HuggingFace format"""
+    # If it already has org/name format, use it
+    if "/" in model_name:
+        return model_name
+
+    # Otherwise, try to identify organization from common patterns
+    name_lower = model_name.lower()
+
+    for pattern, org in _ORG_MAPPING.items():
+        if pattern in name_lower:
+            return f"{org}/{model_name}"
+
+    # Default: use model name as both org and model
+    return f"unknown/{model_name}"
+
+
+@lru_cache(maxsize=1024)
+def _categorize_benchmark(name: str) -> str:
+    """Categorize benchmark by type"""
+    name_lower = name.lower()
+
+    if any(x in name_lower for x in ["code", "human", "swe", "live"]):
+        return "coding"
+    elif any(x in name_lower for x in ["math", "gsm", "aime", "gpqa"]):
+        return "reasoning"
+    elif any(x in name_lower for x in ["mmlu", "arc", "truthful", "winogrande"]):
+        return "knowledge"
+    else:
+        return "general"
 
 
 class LLMStatsScraper:
     """Scraper for llm-stats.com Open LLM Leaderboard"""
 
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, cache_dir: Path = DEFAULT_CACHE_DIR):
         self.url = "https://llm-stats.com/leaderboards/open-llm-leaderboard"
         self.headless = headless
+        self.cache_dir = Path(cache_dir)
         self._cache = {}
+        self._debug_count = 0  # Rows logged at DEBUG level so far
+        self._headers: Optional[List[str]] = None  # Column headers of the last scraped table
+
+        # Browser session, opened by __aenter__ and reused across scrapes
+        self._pw: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._context: Optional[BrowserContext] = None
+
+    async def __aenter__(self) -> "LLMStatsScraper":
+        """Launch Chromium once and keep a browser context warm for this session"""
+        self._pw = await async_playwright().start()
+        try:
+            self._browser = await self._pw.chromium.launch(headless=self.headless)
+            self._context = await self._browser.new_context()
+            await self._context.route("**/*", self._block_heavy_resources)
+        except BaseException:
+            # __aexit__ won't run, so don't leak the browser or Playwright driver
+            try:
+                if self._browser is not None:
+                    await self._browser.close()
+            finally:
+                await self._pw.stop()
+                self._pw = self._browser = self._context = None
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            await self._context.close()
+            await self._browser.close()
+        finally:
+            await self._pw.stop()
+            self._pw = self._browser = self._context = None
+
+    @staticmethod
+    async def _block_heavy_resources(route: Route):
+        """Abort requests for resources the table extraction doesn't use"""
+        if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
 
     async def scrape_leaderboard(self) -> List[Dict]:
         """
@@ -20,41 +192,143 @@ class LLMStatsScraper:
         Returns:
             List of model data dictionaries with benchmarks
         """
-        print(f"\nScraping Open LLM Leaderboard from {self.url}...")
+        models = []
+        async for batch in self.stream_models():
+            models.extend(batch)
+        return models
 
-        async with async_playwright() as p:
-            # Launch browser
-            browser = await p.chromium.launch(headless=self.headless)
-            page = await browser.new_page()
+    async def stream_models(self, batch_size: int = 20) -> AsyncIterator[List[Dict]]:
+        """
+        Scrape the leaderboard, yielding models in batches
 
-            try:
-                # Navigate to leaderboard
-                print("Loading page...")
-                await page.goto(self.url, wait_until="networkidle", timeout=60000)
+        Batches let callers start follow-up work (e.g. HuggingFace
+        enrichment) per batch. If the page is unchanged since the last
+        scrape, the cached models are yielded without launching a browser.
 
-                # Wait for the table to load
-                print("Waiting for leaderboard table...")
-                await page.wait_for_selector("table, [role='table'], .leaderboard", timeout=30000)
+        Args:
+            batch_size: Number of models per yielded batch
 
-                # Give extra time for JavaScript to fully render
-                await asyncio.sleep(3)
+        Yields:
+            Lists of model data dictionaries with benchmarks
+        """
+        models, validators = await self._revalidate_cached_leaderboard()
+
+        if models is not None:
+            for i in range(0, len(models), batch_size):
+                yield models[i:i + batch_size]
+            return
+
+        # Without an open session, launch a browser just for this scrape
+        if self._context is None:
+            async with self:
+                async for batch in self._stream_scraped_models(batch_size, validators):
+                    yield batch
+        else:
+            async for batch in self._stream_scraped_models(batch_size, validators):
+                yield batch
 
-                # Extract data from the page
-                models = await self._extract_models(page)
+    async def _stream_scraped_models(self, batch_size: int, validators: Dict) -> AsyncIterator[List[Dict]]:
+        """Scrape the page and yield its models in batches while the session is still open"""
+        models = await self._scrape_page()
 
-                print(f"✓ Successfully scraped {len(models)} models from llm-stats.com")
-                return models
+        if models and validators:
+            self._store_cached_leaderboard(models, validators)
 
-            except PlaywrightTimeoutError as e:
-                print(f"Timeout waiting for page to load: {e}")
-                return []
-            except Exception as e:
-                print(f"Error scraping llm-stats.com: {e}")
-                import traceback
-                traceback.print_exc()
-                return []
-            finally:
-                await browser.close()
+        for i in range(0, len(models), batch_size):
+            yield models[i:i + batch_size]
+
+    async def _revalidate_cached_leaderboard(self):
+        """
+        Check the cached leaderboard against the live page with a HEAD request
+
+        Returns:
+            (cached models or None, the page's current validators)
+        """
+        cache_file = self.cache_dir / LEADERBOARD_CACHE_FILE
+        try:
+            cached = orjson.loads(cache_file.read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            cached = {}
+
+        headers = {}
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+        try:
+            async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
+                response = await client.head(self.url, headers=headers)
+        except httpx.HTTPError as e:
+            logger.warning("Could not revalidate llm-stats.com leaderboard: %s", e)
+            return None, {}
+
+        validators = {
+            'etag': response.headers.get('etag'),
+            'last_modified': response.headers.get('last-modified'),
+        }
+        if response.status_code == 304 and headers:
+            # A 304 needn't repeat the validators; the cached ones still apply
+            validators = {
+                'etag': validators['etag'] or cached.get('etag'),
+                'last_modified': validators['last_modified'] or cached.get('last_modified'),
+            }
+        if not any(validators.values()):
+            return None, {}
+
+        # Some servers ignore conditional HEADs, so also compare validators
+        unchanged = response.status_code == 304 or (
+            response.status_code == 200
+            and validators['etag'] == cached.get('etag')
+            and validators['last_modified'] == cached.get('last_modified')
+        )
+        if unchanged and cached.get('models'):
+            logger.info("✓ llm-stats.com leaderboard unchanged, using %d cached models", len(cached['models']))
+            return cached['models'], validators
+
+        return None, validators
+
+    def _store_cached_leaderboard(self, models: List[Dict], validators: Dict):
+        """Persist parsed models with the validators they were scraped under"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_file = self.cache_dir / LEADERBOARD_CACHE_FILE
+        cache_file.write_bytes(orjson.dumps({**validators, 'models': models}))
+
+    async def _scrape_page(self) -> List[Dict]:
+        """Load the leaderboard in the open browser context and extract its models"""
+        logger.info("Scraping Open LLM Leaderboard from %s...", self.url)
+
+        page = await self._context.new_page()
+
+        try:
+            # Navigate to leaderboard
+            logger.info("Loading page...")
+            await page.goto(self.url, wait_until="networkidle", timeout=60000)
+
+            # Wait for the table to load
+            logger.info("Waiting for leaderboard table...")
+            await page.wait_for_selector("table, [role='table'], .leaderboard", timeout=30000)
+
+            # Wait until JavaScript has finished rendering rows
+            try:
+                await page.wait_for_function(_ROWS_STABLE_JS, polling=200, timeout=10000)
+            except PlaywrightTimeoutError:
+                logger.warning("Row count did not settle, extracting what has rendered")
+
+            # Extract data from the page
+            models = await self._extract_models(page)
+
+            logger.info("✓ Successfully scraped %d models from llm-stats.com", len(models))
+            return models
+
+        except PlaywrightTimeoutError as e:
+            logger.error("Timeout waiting for page to load: %s", e)
+            return []
+        except Exception as e:
+            logger.exception("Error scraping llm-stats.com: %s", e)
+            return []
+        finally:
+            await page.close()
 
     async def _extract_models(self, page: Page) -> List[Dict]:
         """Extract model data from the leaderboard page"""
@@ -62,71 +336,83 @@ class LLMStatsScraper:
         # Try to extract data from the rendered page
         # This will depend on the actual HTML structure
         models = []
+        self._headers = None
 
         try:
-            # Get all table rows (adjust selector based on actual structure)
-            rows = await page.query_selector_all("table tbody tr, [role='row']")
-
-            if not rows:
-                # Try alternative selectors
-                rows = await page.query_selector_all("tr.model-row, .leaderboard-item, [data-model]")
+            # Get the header texts, then the cell texts of all table rows,
+            # in one evaluate() call each
+            headers = await page.evaluate(_HEADERS_JS)
+            rows = await page.evaluate(_ROWS_JS)
+        except Exception as e:
+            logger.warning("Error finding table rows: %s", e)
 
-            print(f"Found {len(rows)} rows to process")
+            # Fallback: parse the rendered HTML in-process
+            try:
+                html = await page.content()
+                headers, rows = self._table_from_html(html)
+                if not rows:
+                    # Look for embedded JSON data in script tags
+                    return self._extract_from_page_source(html)
+            except Exception as e2:
+                logger.error("Fallback extraction also failed: %s", e2)
+                return models
 
-            for row in rows:
-                try:
-                    model_data = await self._extract_model_from_row(row, page)
-                    if model_data:
-                        models.append(model_data)
-                except Exception as e:
-                    print(f"Error extracting model from row: {e}")
-                    continue
+        self._headers = [_WS_RE.sub(' ', h).strip() for h in headers] or None
 
-        except Exception as e:
-            print(f"Error finding table rows: {e}")
+        logger.info("Found %d rows to process", len(rows))
 
-            # Fallback: Try to find data in JavaScript variables or JSON
+        for row_cells in rows:
             try:
-                # Look for embedded JSON data in script tags
-                script_content = await page.content()
-                models = self._extract_from_page_source(script_content)
-            except Exception as e2:
-                print(f"Fallback extraction also failed: {e2}")
+                model_data = self._extract_model_from_row(row_cells)
+                if model_data:
+                    models.append(model_data)
+            except Exception as e:
+                logger.warning("Error extracting model from row: %s", e)
+                continue
 
         return models
 
-    async def _extract_model_from_row(self, row, page: Page) -> Optional[Dict]:
-        """Extract model information from a table row"""
+    def _table_from_html(self, html: str):
+        """
+        Collect header texts and each row's cell texts from page HTML,
+        mirroring _HEADERS_JS and _ROWS_JS
 
-        try:
-            # Get text content from the row
-            text_content = await row.inner_text()
+        Returns:
+            (header texts, list of per-row cell texts)
+        """
+        soup = BeautifulSoup(html, _HTML_PARSER)
+
+        headers = [th.get_text(" ") for th in soup.select("table thead th, [role='columnheader']")]
 
-            # Debug: print first few rows
-            if not hasattr(self, '_debug_count'):
-                self._debug_count = 0
+        rows = soup.select("table tbody tr, [role='row']")
+        if not rows:
+            rows = soup.select("tr.model-row, .leaderboard-item, [data-model]")
 
-            if self._debug_count < 3:
-                print(f"\nDEBUG Row {self._debug_count + 1}: {text_content[:200]}")
+        return headers, [
+            [cell.get_text(" ") for cell in row.select("td, [role='cell']")]
+            for row in rows
+        ]
+
+    def _extract_model_from_row(self, cells: List[str]) -> Optional[Dict]:
+        """Extract model information from a table row's cell texts"""
+
+        try:
+            # Debug: log first few rows (skipped entirely unless DEBUG is on)
+            debug_row = self._debug_count < 3 and logger.isEnabledFor(logging.DEBUG)
+            if debug_row:
                 self._debug_count += 1
+                logger.debug("Row %d: %.200s", self._debug_count, ' | '.join(cells))
 
-            # Extract all cell values first
-            cells = await row.query_selector_all("td, [role='cell']")
             if not cells:
                 return None
 
-            cell_values = []
-            for cell in cells:
-                text = await cell.inner_text()
-                # Clean up whitespace and filter empty cells
-                cleaned = text.strip().replace('\n', ' ').replace('\t', ' ')
-                # Remove extra spaces
-                cleaned = ' '.join(cleaned.split())
-                if cleaned:  # Only add non-empty cells
-                    cell_values.append(cleaned)
+            # Collapse whitespace runs in one pass, then filter empty cells
+            # (the unfiltered row stays aligned with the header columns)
+            cleaned_cells = [_WS_RE.sub(' ', text).strip() for text in cells]
+            cell_values = [cell for cell in cleaned_cells if cell]
 
-            if self._debug_count < 3:
-                print(f"Cells: {cell_values}")
+            if debug_row:
+                logger.debug("Cells: %s", cell_values)
 
             if len(cell_values) < 2:
                 return None
@@ -166,10 +452,10 @@ class LLMStatsScraper:
                     output_price = self._extract_price(price2)
 
             # Parse benchmarks from remaining cells
-            benchmarks = self._parse_benchmarks_from_cells(cell_values)
+            benchmarks = self._parse_benchmarks_from_cells(cleaned_cells, self._headers)
 
             # Extract model ID (organization/model-name format)
-            model_id = self._extract_model_id(model_name)
+            model_id = _extract_model_id(model_name)
 
             # Extract parameters if available
             parameters = self._extract_parameters_from_cells(cell_values)
@@ -187,49 +473,78 @@ class LLMStatsScraper:
             }
 
         except Exception as e:
-            print(f"Error in _extract_model_from_row: {e}")
+            logger.warning("Error in _extract_model_from_row: %s", e)
             return None
 
-    def _parse_benchmarks_from_cells(self, cells: List[str]) -> List[Dict]:
-        """Parse benchmark scores from table cells"""
-        benchmarks = []
+    def _parse_benchmarks_from_cells(
+        self, cells: List[str], headers: Optional[List[str]] = None
+    ) -> List[Dict]:
+        """
+        Parse benchmark scores from table cells
 
-        # Based on the observed data, benchmarks appear as percentages
-        # The columns seem to be: Flag, Model, Price1, Price2, Score1%, Score2%, Score3%, Score4%, etc.
+        Args:
+            cells: The row's cell texts, including empty cells
+            headers: The table's column headers, if detected
 
-        # Common benchmark names for llm-stats.com
-        # These are estimates based on common leaderboards - you may need to scrape headers to get exact names
-        benchmark_names = [
-            "MMLU", "Arc-Challenge", "HellaSwag", "TruthfulQA", "Winogrande", "GSM8K",
-            "GPQA", "AIME", "MATH", "HumanEval"
-        ]
+        Returns:
+            List of benchmark dicts (name, score, category)
+        """
+        benchmarks = []
 
-        # Extract all percentage scores
-        score_index = 0
-        for cell in cells:
-            # Look for percentage values
-            if '%' in cell:
-                score = self._extract_score(cell)
+        if headers and len(headers) == len(cells):
+            # Name each score by its column header
+            for header, cell in zip(headers, cells):
+                score = self._parse_percentage(cell)
                 if score is not None:
-                    # Assign benchmark name
-                    if score_index < len(benchmark_names):
-                        benchmark_name = benchmark_names[score_index]
+                    benchmark_name = header or f"Benchmark_{len(benchmarks) + 1}"
+                    benchmarks.append({
+                        "name": benchmark_name,
+                        "score": score,
+                        "category": _categorize_benchmark(benchmark_name)
+                    })
+        else:
+            # No usable headers: benchmarks appear as percentages, in the order
+            # Flag, Model, Price1, Price2, Score1%, Score2%, Score3%, Score4%, etc.
+            for cell in cells:
+                score = self._parse_percentage(cell)
+                if score is not None:
+                    # Assign benchmark names positionally
+                    score_index = len(benchmarks)
+                    if score_index < len(_BENCHMARK_NAMES):
+                        benchmark_name = _BENCHMARK_NAMES[score_index]
                     else:
                         benchmark_name = f"Benchmark_{score_index + 1}"
 
                     benchmarks.append({
                         "name": benchmark_name,
                         "score": score,
-                        "category": self._categorize_benchmark(benchmark_name)
+                        "category": _categorize_benchmark(benchmark_name)
                     })
-                    score_index += 1
 
         return benchmarks
 
+    def _parse_percentage(self, cell: str) -> Optional[float]:
+        """Parse a percentage cell's score, or None if the cell isn't a percentage"""
+        # Plain "86.0%" cells skip the regex
+        if cell.endswith('%'):
+            try:
+                score = float(cell[:-1].replace(',', ''))
+            except ValueError:
+                score = None
+            # float() also accepts "inf"/"nan"; leave those to the regex
+            if score is None or not math.isfinite(score):
+                score = self._extract_score(cell)
+            return score
+
+        if '%' in cell:
+            return self._extract_score(cell)
+
+        return None
+
     def _extract_score(self, text: str) -> Optional[float]:
         """Extract numeric score from text"""
         # Remove any non-numeric characters except dots and minus
-        numbers = re.findall(r'-?\d+\.?\d*', text)
+        numbers = _SCORE_RE.findall(text)
         if numbers:
             try:
                 return float(numbers[0])
@@ -239,7 +554,7 @@ class LLMStatsScraper:
 
     def _extract_price(self, text: str) -> Optional[float]:
         """Extract price from text like '$0.60'"""
-        numbers = re.findall(r'\$?(\d+\.?\d*)', text)
+        numbers = _PRICE_RE.findall(text)
         if numbers:
             try:
                 return float(numbers[0])
@@ -259,81 +574,22 @@ class LLMStatsScraper:
                     return f"{num}B"
         return None
 
-    def _extract_model_id(self, model_name: str) -> str:
-        """Extract or construct model ID matching HuggingFace format"""
-        # If it already has org/name format, use it
-        if "/" in model_name:
-            return model_name
-
-        # Otherwise, try to identify organization from common patterns
-        name_lower = model_name.lower()
-
-        # Comprehensive org mapping for HuggingFace
-        org_mapping = {
-            # Chinese models
-            "glm": "THUDM",  # GLM-4.7 -> THUDM/glm-4-9b-chat
-            "kimi": "MoonshotAI",  # Kimi -> MoonshotAI
-            "mimo": "AIDC-AI",  # MiMo -> AIDC-AI
-            "qwen": "Qwen",
-            "yi": "01-ai",
-            "deepseek": "deepseek-ai",
-
-            # Western models
-            "llama": "meta-llama",
-            "mistral": "mistralai",
-            "mixtral": "mistralai",
-            "gemma": "google",
-            "gemini": "google",
-            "phi": "microsoft",
-            "gpt": "openai",
-            "claude": "anthropic",
-
-            # Other orgs
-            "nemotron": "nvidia",
-            "hermes": "NousResearch",
-            "nous": "NousResearch",
-            "solar": "upstage",
-            "commandr": "CohereForAI",
-            "aya": "CohereForAI",
-        }
-
-        for pattern, org in org_mapping.items():
-            if pattern in name_lower:
-                return f"{org}/{model_name}"
-
-        # Default: use model name as both org and model
-        return f"unknown/{model_name}"
-
-    def _categorize_benchmark(self, name: str) -> str:
-        """Categorize benchmark by type"""
-        name_lower = name.lower()
-
-        if any(x in name_lower for x in ["code", "human", "swe", "live"]):
-            return "coding"
-        elif any(x in name_lower for x in ["math", "gsm", "aime", "gpqa"]):
-            return "reasoning"
-        elif any(x in name_lower for x in ["mmlu", "arc", "truthful", "winogrande"]):
-            return "knowledge"
-        else:
-            return "general"
-
     def _extract_from_page_source(self, html: str) -> List[Dict]:
         """Extract data from page source as fallback"""
         models = []
 
         # Try to find JSON data in script tags
-        json_pattern = r'(?:data|models|leaderboard)\s*[=:]\s*(\[{.*?}\])'
-        matches = re.findall(json_pattern, html, re.DOTALL)
+        matches = _JSON_RE.findall(html)
 
         for match in matches:
             try:
-                data = json.loads(match)
+                data = orjson.loads(match)
                 if isinstance(data, list) and len(data) > 0:
                     # Process the JSON data
                     for item in data:
                         if isinstance(item, dict) and 'model' in item or 'name' in item:
                             models.append(self._normalize_json_model(item))
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 continue
 
         return models
@@ -343,7 +599,7 @@ class LLMStatsScraper:
         model_name = item.get('model') or item.get('name') or item.get('modelId', '')
 
         return {
-            "model_id": self._extract_model_id(model_name),
+            "model_id": _extract_model_id(model_name),
             "model_name": model_name,
             "organization": model_name.split("/")[0] if "/" in model_name else "unknown",
             "benchmarks": [],  # Will be populated from item data
@@ -367,4 +623,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     asyncio.run(main())
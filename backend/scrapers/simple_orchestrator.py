@@ -1,10 +1,48 @@
 import asyncio
-import json
-from datetime import datetime
+import heapq
+import logging
+import os
+import re
+import sys
+from datetime import datetime, timedelta
+from itertools import zip_longest
+from logging.handlers import QueueHandler, QueueListener
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict
+from queue import SimpleQueue
+from typing import AsyncIterator, List, Dict, Optional
 import httpx
-from huggingface_scraper import HuggingFaceScraper
+import orjson
+from huggingface_scraper import AsyncTokenBucket, HuggingFaceScraper
+
+try:
+    import zstandard
+except ImportError:  # zstandard is optional; only needed for .zst snapshots
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+
+# Filtered HuggingFace API listing, stored next to the output file
+LISTING_CACHE_FILE = ".hf_trending.json"
+
+# Substrings that mark a license as open (matched case-insensitively)
+OPEN_LICENSES = (
+    'apache', 'mit', 'llama', 'openrail', 'cc-by', 'bsd', 'bigscience',
+    'deepseek', 'gemma', 'qwen',
+)
+
+# Organizations known to publish open models (matched case-sensitively)
+OPEN_ORGS = (
+    'meta-llama', 'deepseek-ai', 'Qwen', 'mistralai', 'google', 'microsoft',
+    'nvidia', 'allenai', '01-ai', 'tencent', 'NousResearch', 'upstage',
+    'teknium', 'zai-org',
+)
+
+# Each token list compiles to one alternation, so a check is a single
+# C-level scan over the string rather than one scan per token
+_OPEN_LICENSE_RE = re.compile('|'.join(map(re.escape, OPEN_LICENSES)), re.IGNORECASE)
+_OPEN_ORG_RE = re.compile('|'.join(map(re.escape, OPEN_ORGS)))
 
 
 class SimpleOrchestrator:
@@ -12,8 +50,45 @@ class SimpleOrchestrator:
 
     def __init__(self, output_file: str = "../data/models.json"):
         self.output_file = Path(__file__).parent / output_file
-        self.hf_scraper = HuggingFaceScraper(delay_between_requests=0.5)
+        # An output path ending in .zst (e.g. models.json.zst) opts into a
+        # zstd-compressed snapshot
+        self.compressed = self.output_file.suffix == ".zst"
+        if self.compressed and zstandard is None:
+            raise ImportError("zstandard is required for .zst snapshots (pip install zstandard)")
+        # One rate budget for the API listing and every page scrape
+        self._rate = AsyncTokenBucket(6.0, capacity=3)
+        self.hf_scraper = HuggingFaceScraper(rate_limiter=self._rate)
         self.hf_api_url = "https://huggingface.co/api/models"
+        # Listing query, fixed apart from the limit: trending (or 'downloads',
+        # 'likes') text generation models. Encoded once here so each call
+        # only appends the limit. The default fields (id and tags) are all the
+        # filter reads, so full model cards aren't requested.
+        self._listing_url = f"{self.hf_api_url}?filter=text-generation&sort=trending&limit="
+        self._author_listing_url = f"{self.hf_api_url}?filter=text-generation&sort=trending&author="
+        # Filtered ID list from the last API listing, revalidated by ETag
+        self.listing_cache_file = self.output_file.with_name(LISTING_CACHE_FILE)
+        self._client: Optional[httpx.AsyncClient] = None  # Shared client, opened by __aenter__
+
+    async def __aenter__(self) -> "SimpleOrchestrator":
+        """Open one pooled HTTP/2 client for the API listing and every page scrape"""
+        self._client = httpx.AsyncClient(
+            timeout=30.0,
+            follow_redirects=True,
+            http2=True,
+            # HTTP/2 multiplexes concurrent requests over one connection per
+            # origin, so a small pool is enough
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def fetch_models_from_hf_api(self, limit: int = 100) -> List[str]:
         """
@@ -25,62 +100,178 @@ class SimpleOrchestrator:
         Returns:
             List of model IDs
         """
-        print("\n[1/2] Fetching models from HuggingFace API...")
+        # Called outside a session: open a client just for this call
+        if self._client is None:
+            async with self:
+                return await self.fetch_models_from_hf_api(limit)
 
-        params = {
-            'filter': 'text-generation',  # Only text generation models
-            'sort': 'trending',  # Sort by trending (or 'downloads', 'likes')
-            'limit': limit,
-            'full': 'true'
-        }
+        logger.info("\n[1/2] Fetching models from HuggingFace API...")
+
+        # Revalidate the last listing instead of re-downloading and re-filtering it
+        cached = self._load_listing_cache()
+        headers = {}
+        if cached.get('etag') and cached.get('limit') == limit:
+            headers['If-None-Match'] = cached['etag']
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(self.hf_api_url, params=params)
-                response.raise_for_status()
-                models_data = response.json()
-
-                # Extract model IDs and filter for open-source
-                model_ids = []
-                for model in models_data:
-                    model_id = model.get('id') or model.get('modelId')
-                    if not model_id:
-                        continue
+            await self._rate.acquire()
+            response = await self._client.get(f"{self._listing_url}{limit}", headers=headers)
+
+            if response.status_code == 304 and headers:
+                model_ids = cached['model_ids']
+                logger.info("✓ HuggingFace API listing unchanged, reusing %d cached model IDs", len(model_ids))
+                return model_ids
+
+            response.raise_for_status()
+            models_data = orjson.loads(response.content)
+
+            # Extract model IDs and filter for open-source
+            model_ids = []
+            for model in models_data:
+                # The /api/models listing always keys models by 'id'
+                if not (model_id := model.get('id')):
+                    continue
+
+                # Filter for likely open-source models
+                # Check if model has an open license or is from known open orgs
+                is_likely_open = self._is_likely_open_source(model)
 
-                    # Filter for likely open-source models
-                    # Check if model has an open license or is from known open orgs
-                    is_likely_open = self._is_likely_open_source(model)
+                if is_likely_open:
+                    model_ids.append(model_id)
 
-                    if is_likely_open:
-                        model_ids.append(model_id)
+            model_ids = model_ids[:limit]
+            if response.headers.get('etag'):
+                self._store_listing_cache(limit, response.headers['etag'], model_ids)
 
-                print(f"✓ Found {len(model_ids)} trending open-source models from HuggingFace API")
-                return model_ids[:limit]
+            logger.info("✓ Found %d trending open-source models from HuggingFace API", len(model_ids))
+            return model_ids
 
         except Exception as e:
-            print(f"Error fetching from HuggingFace API: {e}")
+            logger.error("Error fetching from HuggingFace API: %s", e)
             # Fallback to curated list
             return self._get_fallback_models()
 
+    def _load_listing_cache(self) -> Dict:
+        """Load the cached API listing, or an empty dict if there is none"""
+        try:
+            return orjson.loads(self.listing_cache_file.read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return {}
+
+    def _store_listing_cache(self, limit: int, etag: str, model_ids: List[str]):
+        """Persist the filtered ID list with the ETag of the listing it came from"""
+        self.listing_cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self.listing_cache_file.write_bytes(orjson.dumps({
+            'limit': limit,
+            'etag': etag,
+            'model_ids': model_ids,
+        }))
+
+    async def fetch_models_by_author(self, author: str, limit: int) -> List[str]:
+        """
+        Fetch trending text generation model IDs published by one organization
+
+        Args:
+            author: HuggingFace organization or user name
+            limit: Number of models to fetch
+
+        Returns:
+            List of model IDs, or an empty list if the listing failed
+        """
+        try:
+            await self._rate.acquire()
+            response = await self._client.get(f"{self._author_listing_url}{author}&limit={limit}")
+            response.raise_for_status()
+            return [model['id'] for model in orjson.loads(response.content) if model.get('id')]
+        except Exception as e:
+            logger.warning("Error fetching %s models from HuggingFace API: %s", author, e)
+            return []
+
+    async def stream_model_ids(self, limit: int = 100, by_author: bool = True) -> AsyncIterator[str]:
+        """
+        Yield open-source model IDs from the HuggingFace API
+
+        Args:
+            limit: Number of models to fetch
+            by_author: List each known open organization's models server-side,
+                instead of filtering the overall trending listing client-side
+                (the trending listing is the one revalidated by ETag)
+
+        Yields:
+            Model IDs
+        """
+        if not by_author:
+            for model_id in await self.fetch_models_from_hf_api(limit):
+                yield model_id
+            return
+
+        # Called outside a session: open a client just for this listing
+        if self._client is None:
+            async with self:
+                async for model_id in self.stream_model_ids(limit, by_author):
+                    yield model_id
+            return
+
+        logger.info("\n[1/2] Fetching models from HuggingFace API...")
+
+        # One small listing per organization, all multiplexed over the shared
+        # HTTP/2 connection. Every ID is open by construction, so no listing
+        # needs the full model cards or the client-side filter.
+        per_author = -(-limit // len(OPEN_ORGS))
+        tasks = [
+            asyncio.ensure_future(self.fetch_models_by_author(org, per_author))
+            for org in OPEN_ORGS
+        ]
+
+        # Every organization is guaranteed its top `quota` IDs, so those are
+        # yielded as each listing arrives and scraping starts right away
+        quota = limit // len(OPEN_ORGS)
+        found = 0
+        try:
+            for listing in asyncio.as_completed(tasks):
+                for model_id in (await listing)[:quota]:
+                    found += 1
+                    yield model_id
+
+            # Fill the remaining slots round-robin in OPEN_ORGS order, so which
+            # IDs are selected doesn't depend on which response arrived first
+            remainder = [
+                model_id
+                for ranked in zip_longest(*(task.result()[quota:] for task in tasks))
+                for model_id in ranked
+                if model_id is not None
+            ]
+            for model_id in remainder[:limit - found]:
+                found += 1
+                yield model_id
+        finally:
+            # The consumer may stop early; drop listings still in flight
+            for task in tasks:
+                task.cancel()
+
+        if found:
+            logger.info("✓ Found %d open-source models from %d organizations", found, len(OPEN_ORGS))
+        else:
+            # Fallback to curated list
+            for model_id in self._get_fallback_models():
+                yield model_id
+
     def _is_likely_open_source(self, model_data: Dict) -> bool:
         """Check if a model is likely open source"""
         # Check license
-        license_info = model_data.get('cardData', {}).get('license', '')
-        open_licenses = [
-            'apache', 'mit', 'llama', 'openrail', 'cc-by', 'bsd',
-            'bigscience', 'deepseek', 'gemma', 'qwen'
-        ]
-        if license_info and any(lic in license_info.lower() for lic in open_licenses):
+        license_info = (model_data.get('cardData') or {}).get('license')
+        if not license_info:
+            # Listings without full=true carry the license as a "license:<id>" tag
+            license_info = next(
+                (tag for tag in model_data.get('tags', ()) if tag.startswith('license:')),
+                '',
+            )
+        if license_info and _OPEN_LICENSE_RE.search(license_info):
             return True
 
         # Check organization
         model_id = model_data.get('id', '')
-        open_orgs = [
-            'meta-llama', 'deepseek-ai', 'Qwen', 'mistralai', 'google',
-            'microsoft', 'nvidia', 'allenai', '01-ai', 'tencent',
-            'NousResearch', 'upstage', 'teknium', 'zai-org'
-        ]
-        if any(org in model_id for org in open_orgs):
+        if _OPEN_ORG_RE.search(model_id):
             return True
 
         return False
@@ -129,42 +320,115 @@ class SimpleOrchestrator:
             "zai-org/GLM-4.7",
         ]
 
-    async def collect_all_data(self, max_models: int = 50) -> List[Dict]:
+    async def collect_all_data(
+        self,
+        max_models: int = 50,
+        refresh_after: int = 86400,
+        max_concurrent: int = 8,
+        by_author: bool = True,
+    ) -> List[Dict]:
         """
         Collect model data from HuggingFace
 
         Args:
             max_models: Maximum number of models to collect
+            refresh_after: Seconds before a model in the previous snapshot is re-scraped
+            max_concurrent: Number of concurrent scrape workers
+            by_author: Collect the known open organizations' models; False uses
+                the filtered trending listing, revalidated by ETag, instead
 
         Returns:
             List of model data dictionaries
         """
-        print("=" * 60)
-        print("Starting data collection from HuggingFace...")
-        print("=" * 60)
+        # Share one client between the API listing and the page scrapes
+        if self._client is None:
+            async with self:
+                return await self.collect_all_data(max_models, refresh_after, max_concurrent, by_author)
 
-        # Fetch model IDs
-        model_ids = await self.fetch_models_from_hf_api(limit=max_models * 2)
+        logger.info("=" * 60)
+        logger.info("Starting data collection from HuggingFace...")
+        logger.info("=" * 60)
 
-        # Limit to requested number
-        model_ids = model_ids[:max_models]
+        # Feed model IDs through a bounded queue to a fixed pool of scrape
+        # workers, so scraping starts as soon as the first ID is known
+        queue: asyncio.Queue = asyncio.Queue(maxsize=32)
+        results: Dict[int, Dict] = {}  # Keyed by position, to keep API order
 
-        # Scrape detailed data for each model
-        print(f"\n[2/2] Scraping detailed data for {len(model_ids)} models...")
-        print("This may take a few minutes...")
+        # Models from the previous snapshot that are recent enough to reuse
+        try:
+            previous = self.load_data().get('models', [])
+        except (OSError, ValueError) as e:
+            logger.warning("Could not read previous snapshot: %s", e)
+            previous = []
+        cutoff = (datetime.now() - timedelta(seconds=refresh_after)).isoformat()
+        fresh = {
+            m['model_id']: m for m in previous
+            if m.get('model_id') and m.get('last_scraped', '') >= cutoff
+        }
 
-        models = await self.hf_scraper.scrape_models_batch(model_ids, max_concurrent=3)
+        async def produce():
+            seen = set()
+            try:
+                count = 0
+                # The trending listing is over-fetched to make up for models the
+                # open-source filter drops; author listings need no filtering
+                limit = max_models if by_author else max_models * 2
+                async for model_id in self.stream_model_ids(limit=limit, by_author=by_author):
+                    # Limit to requested number
+                    if count >= max_models:
+                        break
+                    count += 1
+
+                    if not seen:
+                        logger.info("\n[2/2] Scraping detailed data for up to %d models...", max_models)
+                        logger.info("This may take a few minutes...")
+
+                    if model_id in seen:
+                        continue
+                    seen.add(model_id)
+
+                    # Only queue models that are new or stale
+                    if model_id in fresh:
+                        results[len(seen)] = fresh[model_id]
+                    else:
+                        await queue.put((len(seen), model_id))
+            finally:
+                # One stop marker per worker
+                for _ in range(max_concurrent):
+                    await queue.put(None)
+
+        async def consume():
+            while (item := await queue.get()) is not None:
+                position, model_id = item
+                result = await self.hf_scraper.scrape_model(model_id, client=self._client)
+                if result is not None:
+                    # Stamp when the data was actually fetched; the scraper
+                    # may have served it from its disk cache
+                    fetched_at = self.hf_scraper.fetched_at(model_id)
+                    scraped = datetime.fromtimestamp(fetched_at) if fetched_at else datetime.now()
+                    result['last_scraped'] = scraped.isoformat()
+                    results[position] = result
+
+        # Scrape detailed data for each model
+        await asyncio.gather(produce(), *(consume() for _ in range(max_concurrent)))
+        models = [results[position] for position in sorted(results)]
 
         # Filter for models with actual data
         valid_models = [m for m in models if m.get('model_id')]
-        print(f"✓ Successfully scraped {len(valid_models)} models")
+        reused = sum(1 for m in valid_models if fresh.get(m['model_id']) is m)
+        logger.info(
+            "✓ Successfully scraped %d models (%d reused from the last snapshot)",
+            len(valid_models) - reused, reused,
+        )
 
         # Count models with benchmarks
         with_benchmarks = sum(1 for m in valid_models if m.get('benchmarks'))
-        print(f"✓ {with_benchmarks} models have benchmark data")
+        logger.info("✓ %d models have benchmark data", with_benchmarks)
 
         # Save data
-        self._save_data(valid_models)
+        # Serialize, compress and write from a worker thread so the event
+        # loop isn't blocked for the whole save
+        await asyncio.to_thread(self._save_data, valid_models)
 
         return valid_models
 
@@ -183,67 +447,118 @@ class SimpleOrchestrator:
         # Ensure output directory exists
         self.output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Save to JSON
-        with open(self.output_file, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        # Save to JSON (orjson emits UTF-8 bytes, like ensure_ascii=False).
+        # Write a temp file and swap it in, so readers such as the API never
+        # see a half-written snapshot.
+        if self.compressed:
+            # Compact JSON compresses better, and nobody reads the .zst by hand
+            payload = zstandard.ZstdCompressor(level=3).compress(orjson.dumps(output_data))
+        else:
+            payload = orjson.dumps(output_data, option=orjson.OPT_INDENT_2)
+
+        tmp_file = self.output_file.with_suffix(self.output_file.suffix + ".tmp")
+        tmp_file.write_bytes(payload)
+        os.replace(tmp_file, self.output_file)
 
-        print(f"\n✓ Data saved to {self.output_file}")
-        print(f"  Total models: {len(models)}")
-        print(f"  File size: {self.output_file.stat().st_size / 1024:.2f} KB")
+        logger.info("\n✓ Data saved to %s", self.output_file)
+        logger.info("  Total models: %d", len(models))
+        logger.info("  File size: %.2f KB", self.output_file.stat().st_size / 1024)
 
     def load_data(self) -> Dict:
         """Load previously collected data"""
         if not self.output_file.exists():
             return {'models': [], 'total_count': 0}
 
-        with open(self.output_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        payload = self.output_file.read_bytes()
+        if self.compressed:
+            payload = zstandard.ZstdDecompressor().decompress(payload)
+        return orjson.loads(payload)
+
 
+async def main(by_author: bool = True):
+    """
+    Main execution function
 
-async def main():
-    """Main execution function"""
+    Args:
+        by_author: Collect the known open organizations' models rather than
+            the trending listing
+    """
     orchestrator = SimpleOrchestrator()
 
-    print("\n🚀 ModelWatch Data Collection (HuggingFace Only)")
-    print("Collecting latest open-source LLM data...\n")
+    logger.info("\n🚀 ModelWatch Data Collection (HuggingFace Only)")
+    logger.info("Collecting latest open-source LLM data...\n")
 
     try:
-        models = await orchestrator.collect_all_data(max_models=50)
+        async with orchestrator:
+            models = await orchestrator.collect_all_data(max_models=50, by_author=by_author)
 
-        print("\n" + "=" * 60)
-        print("COLLECTION COMPLETE!")
-        print("=" * 60)
+        logger.info("\n" + "=" * 60)
+        logger.info("COLLECTION COMPLETE!")
+        logger.info("=" * 60)
 
         # Show summary statistics
-        print("\n📊 Summary:")
-        print(f"  Total models: {len(models)}")
+        logger.info("\n📊 Summary:")
+        logger.info("  Total models: %d", len(models))
 
         if models:
-            with_benchmarks = sum(1 for m in models if m.get('benchmarks'))
-            print(f"  Models with benchmarks: {with_benchmarks}")
+            # Fetch each model's benchmarks once, tallying in a single pass
+            with_benchmarks = 0
+            total_benchmarks = 0
+            benchmarked = []  # (benchmark count, model) for models with benchmarks
+            for m in models:
+                benchmark_count = len(m.get('benchmarks') or ())
+                if benchmark_count:
+                    with_benchmarks += 1
+                    total_benchmarks += benchmark_count
+                    benchmarked.append((benchmark_count, m))
+
+            logger.info("  Models with benchmarks: %d", with_benchmarks)
+            logger.info("  Total benchmark scores: %d", total_benchmarks)
+
+            # Show top models by benchmark count (only the top 5 are needed,
+            # so skip sorting the whole list)
+            top_models = heapq.nlargest(5, benchmarked, key=itemgetter(0))
+
+            if top_models:
+                logger.info("\n📝 Top models by benchmark count:")
+                for benchmark_count, model in top_models:
+                    logger.info("  - %s", model['model_id'])
+                    logger.info("    Benchmarks: %d", benchmark_count)
+                    logger.info("    License: %s", model.get('license', 'N/A'))
 
-            total_benchmarks = sum(len(m.get('benchmarks', [])) for m in models)
-            print(f"  Total benchmark scores: {total_benchmarks}")
+    except Exception as e:
+        logger.exception("\n❌ Error during collection: %s", e)
 
-            # Show top models by benchmark count
-            models_sorted = sorted(
-                [m for m in models if m.get('benchmarks')],
-                key=lambda x: len(x.get('benchmarks', [])),
-                reverse=True
-            )
 
-            if models_sorted:
-                print("\n📝 Top models by benchmark count:")
-                for model in models_sorted[:5]:
-                    print(f"  - {model['model_id']}")
-                    print(f"    Benchmarks: {len(model.get('benchmarks', []))}")
-                    print(f"    License: {model.get('license', 'N/A')}")
+def _start_log_listener() -> QueueListener:
+    """
+    Send log records through a queue to a background thread
 
-    except Exception as e:
-        print(f"\n❌ Error during collection: {e}")
-        import traceback
-        traceback.print_exc()
+    Coroutines only enqueue records; the listener thread does the stdout
+    writes, so logging never blocks the event loop.
+    """
+    log_queue = SimpleQueue()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(message)s",
+        handlers=[QueueHandler(log_queue)],
+    )
+
+    listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    listener.start()
+    return listener
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Run on uvloop's libuv-based event loop when it's installed
+    try:
+        from uvloop import run
+    except ImportError:
+        run = asyncio.run
+
+    listener = _start_log_listener()
+    try:
+        # --trending collects from the filtered trending listing instead
+        run(main(by_author="--trending" not in sys.argv[1:]))
+    finally:
+        listener.stop()